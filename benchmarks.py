@@ -0,0 +1,362 @@
+"""
+Benchmark suite for the hot paths in this repository.
+
+Runs offline and headless: inputs are generated, input() is fed from a
+script, printing goes to a buffer and sleeps are skipped.
+
+Examples:
+    python benchmarks.py run --output baseline.json
+    python benchmarks.py run --output current.json --baseline baseline.json
+    python benchmarks.py compare baseline.json current.json --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+import fibonacci_recursion
+import inventory_manager
+import number_guessing_game
+import todo_list_functions
+
+WARMUP = 2          # Untimed runs before measuring
+REPEAT = 7          # Timed batches per benchmark
+MIN_BATCH_TIME = 0.05   # Seconds each timed batch should take at least
+THRESHOLD = 0.10    # Allowed slowdown (10%) before compare mode fails
+
+
+# ============================================
+# BENCHMARK CASES
+# ============================================
+# Each case function takes a size and returns a callable to time.
+# Anything done before returning the callable is setup and is not timed.
+
+def bench_fibonacci_recursive(n):
+    """Time fibonacci_recursive(n)."""
+    return lambda: fibonacci_recursion.fibonacci_recursive(n)
+
+
+def bench_fibonacci_loop(n):
+    """Time fibonacci_loop(n)."""
+    return lambda: fibonacci_recursion.fibonacci_loop(n)
+
+
+def bench_provide_hint(count):
+    """Time count provide_hint() calls with random guesses."""
+    rng = random.Random(count)
+    pairs = [(rng.randint(1, 100), rng.randint(1, 100)) for _ in range(count)]
+
+    def run():
+        for guess, secret in pairs:
+            number_guessing_game.provide_hint(guess, secret)
+    return run
+
+
+def bisect_guesses(secret, low, high):
+    """Return the guesses a binary-searching player makes to find secret."""
+    guesses = []
+    while True:
+        guess = (low + high) // 2
+        guesses.append(str(guess))
+        if guess == secret:
+            return guesses
+        if guess < secret:
+            low = guess + 1
+        else:
+            high = guess - 1
+
+
+def bench_play_game(rounds):
+    """Time rounds games of play_game() played by a binary-searching player."""
+    rng = random.Random(rounds)
+    secrets = [rng.randint(number_guessing_game.MIN_NUMBER, number_guessing_game.MAX_NUMBER)
+               for _ in range(rounds)]
+    guesses = [g for s in secrets
+               for g in bisect_guesses(s, number_guessing_game.MIN_NUMBER,
+                                       number_guessing_game.MAX_NUMBER)]
+
+    def run():
+        # Patch once for all rounds so the timing is not mostly mock overhead
+        answers = iter(guesses)
+        with mock.patch.object(number_guessing_game, "generate_secret_number",
+                               side_effect=secrets), \
+             mock.patch("builtins.input", lambda prompt="": next(answers)), \
+             mock.patch.object(number_guessing_game.time, "sleep"):
+            for _ in range(rounds):
+                number_guessing_game.play_game("Bench")
+    return run
+
+
+def bench_todo_add_delete(count):
+    """Time adding count tasks and then deleting them all from the front."""
+    names = [f"task {i}" for i in range(count)]
+
+    def run():
+        todo_list_functions.todo_list.clear()
+        for name in names:
+            todo_list_functions.add_task(name)
+        for _ in names:
+            todo_list_functions.delete_task(1)
+    return run
+
+
+def bench_inventory_load(rows):
+    """Time load_inventory() on a generated file with rows items."""
+    # The file is deleted by run_benchmarks() through run.cleanup
+    handle = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False,
+                                         newline="", encoding="utf-8")
+    with handle:
+        handle.write("name,quantity,price\n")
+        rng = random.Random(rows)
+        for i in range(rows):
+            handle.write(f"item{i},{rng.randint(0, 500)},{rng.uniform(1, 5000):.2f}\n")
+
+    def run():
+        inventory_manager.load_inventory(handle.name)
+    run.cleanup = lambda: os.remove(handle.name)
+    return run
+
+
+# (name, case function, sizes). The first size is used by --quick.
+CASES = [
+    ("fibonacci_recursive", bench_fibonacci_recursive, [10, 15, 20]),
+    ("fibonacci_loop", bench_fibonacci_loop, [100, 1000, 10000]),
+    ("provide_hint", bench_provide_hint, [1000, 10000, 100000]),
+    ("play_game", bench_play_game, [10, 100, 500]),
+    ("todo_add_delete", bench_todo_add_delete, [100, 1000, 5000]),
+    ("inventory_load", bench_inventory_load, [1000, 10000, 100000]),
+]
+
+
+# ============================================
+# HARNESS
+# ============================================
+
+def time_batch(func, number, sink):
+    """Return the seconds taken to call func number times."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = time.perf_counter() - start
+    sink.seek(0)
+    sink.truncate()
+    return elapsed
+
+
+def calibrate(func, sink, min_time=MIN_BATCH_TIME):
+    """
+    Picks how many calls to make per timed batch.
+
+    Like timeit.Timer.autorange(), tries 1, 2, 5, 10, 20, 50, ... calls
+    until a batch takes at least min_time, so very fast functions are not
+    timed at the timer's resolution.
+    """
+    number = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            if time_batch(func, number * multiplier, sink) >= min_time:
+                return number * multiplier
+        number *= 10
+
+
+def measure(func, warmup=WARMUP, repeat=REPEAT):
+    """
+    Times func with warmup and repeats, then records its peak memory.
+
+    Each repeat times a batch of calls (see calibrate()), and the
+    statistics are per call. Output printed by func is discarded so runs
+    stay headless.
+
+    Returns:
+        dict: Per-call timing statistics in seconds and peak memory in bytes.
+    """
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(warmup):
+            time_batch(func, 1, sink)
+        number = calibrate(func, sink)
+        times = [time_batch(func, number, sink) / number for _ in range(repeat)]
+
+        # Separate run for memory, since tracing slows everything down
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "min": min(times),
+        "mean": statistics.mean(times),
+        "median": statistics.median(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+        "peak_memory": peak,
+    }
+
+
+def run_benchmarks(quick=False, pattern=None, warmup=WARMUP, repeat=REPEAT):
+    """
+    Runs every benchmark case and prints a summary line for each.
+
+    Args:
+        quick (bool): Only run the smallest size of each case.
+        pattern (str): Only run benchmarks whose name contains this text.
+
+    Returns:
+        dict: Results keyed by benchmark name, e.g. "fibonacci_loop[1000]".
+    """
+    results = {}
+    for name, case, sizes in CASES:
+        for size in sizes[:1] if quick else sizes:
+            full_name = f"{name}[{size}]"
+            if pattern and pattern not in full_name:
+                continue
+            func = case(size)
+            try:
+                results[full_name] = measure(func, warmup, repeat)
+            finally:
+                if hasattr(func, "cleanup"):
+                    func.cleanup()
+            stats = results[full_name]
+            print(f"{full_name:<32}{stats['median'] * 1000:>12.3f} ms"
+                  f"{stats['peak_memory'] / 1024:>12.1f} KiB")
+    return results
+
+
+def compare_results(baseline, current, threshold=THRESHOLD):
+    """
+    Compares median times of two result sets.
+
+    Benchmarks found in only one of the sets are listed but not compared.
+
+    Returns:
+        list: (name, baseline median, current median) for every benchmark
+        that slowed down by more than threshold.
+    """
+    regressions = []
+    print(f"\n{'Benchmark':<32}{'Baseline':>12}{'Current':>12}{'Change':>10}")
+    print("-" * 66)
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["median"]
+        new = stats["median"]
+        change = (new - old) / old if old else 0.0
+        flag = "  REGRESSED" if change > threshold else ""
+        print(f"{name:<32}{old * 1000:>10.3f}ms{new * 1000:>10.3f}ms{change:>+10.1%}{flag}")
+        if change > threshold:
+            regressions.append((name, old, new))
+
+    missing = sorted(set(baseline) - set(current))
+    added = sorted(set(current) - set(baseline))
+    if missing:
+        print(f"\nIn the baseline but not this run: {', '.join(missing)}")
+    if added:
+        print(f"\nNew since the baseline: {', '.join(added)}")
+    return regressions
+
+
+def load_results(path):
+    """
+    Read the "results" section of a JSON results file.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ValueError: If the file is not a valid results file.
+    """
+    with open(path, encoding="utf-8") as f:
+        try:
+            results = json.load(f)["results"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"{path} is not a benchmark results file")
+    if not isinstance(results, dict):
+        raise ValueError(f"{path} is not a benchmark results file")
+    return results
+
+
+def save_results(results, path):
+    """Write results plus details about the machine to a JSON file."""
+    data = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+# ============================================
+# COMMAND LINE
+# ============================================
+
+def main(argv=None):
+    """Main function - runs or compares benchmarks. Returns an exit code."""
+    parser = argparse.ArgumentParser(description="Benchmark the repository's hot paths")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run the benchmarks")
+    run.add_argument("-o", "--output", default="benchmark_results.json",
+                     help="JSON file to write (default: %(default)s)")
+    run.add_argument("-k", dest="pattern", help="only run benchmarks whose name contains this")
+    run.add_argument("--quick", action="store_true", help="only run the smallest size")
+    run.add_argument("--warmup", type=int, default=WARMUP)
+    run.add_argument("--repeat", type=int, default=REPEAT)
+    run.add_argument("--baseline", help="compare against this results file when done")
+    run.add_argument("--threshold", type=float, default=THRESHOLD,
+                     help="allowed slowdown as a fraction (default: %(default)s)")
+
+    compare = subparsers.add_parser("compare", help="compare two results files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=THRESHOLD,
+                         help="allowed slowdown as a fraction (default: %(default)s)")
+
+    args = parser.parse_args(argv)
+
+    try:
+        # Read the baseline before running so a bad path fails straight away
+        baseline = load_results(args.baseline) if args.baseline else None
+        if args.command == "compare":
+            current = load_results(args.current)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    if args.command == "run":
+        if args.repeat < 1:
+            parser.error("--repeat must be at least 1")
+        results = run_benchmarks(args.quick, args.pattern, args.warmup, args.repeat)
+        save_results(results, args.output)
+        print(f"\nResults saved to {args.output}")
+        if baseline is None:
+            return 0
+        current = results
+
+    regressions = compare_results(baseline, current, args.threshold)
+    if not set(baseline) & set(current):
+        print("\nNo benchmarks in common with the baseline - nothing was compared.")
+        return 1
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
+from instrumentation import instrument
+
+
+@instrument
 def fibonacci_recursive(n):
     """
     Calculates Fibonacci number using RECURSION.
@@ -5,6 +9,12 @@ def fibonacci_recursive(n):
     Fibonacci sequence: 0, 1, 1, 2, 3, 5, 8, 13, 21, 34...
     Each number is the sum of the two before it.
     """
+    # Instrumentation (if enabled) sees only this outer call, not every step
+    return _fibonacci_recursive(n)
+
+
+def _fibonacci_recursive(n):
+    """The recursion behind fibonacci_recursive()."""
     # BASE CASES - stops recursion
     if n <= 0:
         return 0
@@ -12,7 +22,7 @@ def fibonacci_recursive(n):
         return 1
     
     # RECURSIVE CASE - function calls itself
-    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
+    return _fibonacci_recursive(n - 1) + _fibonacci_recursive(n - 2)
 
 
 def fibonacci_loop(n):
@@ -0,0 +1,291 @@
+"""
+Opt-in call counts, latency histograms and error counts for hot functions.
+
+Instrumentation is off unless it is enabled before the instrumented
+modules are imported, either with the INSTRUMENTATION=1 environment
+variable or by calling enable(). While off, @instrument returns the
+original function unchanged, so there is no cost at all.
+
+Environment variables:
+    INSTRUMENTATION          Set to 1 to turn instrumentation on.
+    INSTRUMENTATION_SAMPLE   Fraction of calls to time (default 1.0).
+    INSTRUMENTATION_EXPORT   File to write metrics to when the program
+                             exits (.json for JSON, anything else for
+                             Prometheus text).
+    INSTRUMENTATION_PROFILE  Folder to save cProfile stats for each menu
+                             action wrapped in profile_action().
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import re
+import sys
+import time
+import warnings
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0,
+           float("inf"))
+
+
+class Metric:
+    """Counters and a fixed-bucket latency histogram for one function."""
+
+    def __init__(self, name):
+        """Create an empty metric called name."""
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        self.calls = 0
+        self.errors = 0
+        self.timed = 0              # Calls that were sampled for latency
+        self.total_time = 0.0       # Sum of sampled latencies
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        """Record one sampled latency."""
+        self.timed += 1
+        self.total_time += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def snapshot(self):
+        """Return the metric as a dict of plain values."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timed": self.timed,
+            "total_time": self.total_time,
+            "buckets": {_bucket_label(b): c for b, c in zip(BUCKETS, self.buckets)},
+        }
+
+
+class Registry:
+    """Holds every metric plus the on/off switch and sampling settings."""
+
+    def __init__(self):
+        """Create a registry configured from the environment."""
+        self.metrics = {}
+        self.enabled = os.environ.get("INSTRUMENTATION") == "1"
+        self.sample_every = _sample_from_env() if self.enabled else 1
+        self.profile_dir = os.environ.get("INSTRUMENTATION_PROFILE")
+
+    def get(self, name):
+        """Return the metric called name, creating it if needed."""
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = Metric(name)
+        return metric
+
+    def reset(self):
+        """Set every metric back to zero."""
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def snapshot(self):
+        """Return every metric as a dict keyed by name."""
+        return {name: m.snapshot() for name, m in sorted(self.metrics.items())}
+
+
+def _sample_every(rate):
+    """Turn a sampling fraction into "time one call in every N"."""
+    if not 0 < rate <= 1:
+        raise ValueError(f"Sample rate must be between 0 and 1, got {rate}")
+    return max(1, round(1 / rate))
+
+
+def _sample_from_env():
+    """
+    Read INSTRUMENTATION_SAMPLE, falling back to timing every call.
+
+    A bad value only produces a warning so it cannot stop a program
+    from starting.
+    """
+    value = os.environ.get("INSTRUMENTATION_SAMPLE", "1")
+    try:
+        return _sample_every(float(value))
+    except ValueError:
+        warnings.warn(f"Ignoring INSTRUMENTATION_SAMPLE={value!r}: "
+                      "expected a number between 0 and 1")
+        return 1
+
+
+def _bucket_label(bound):
+    """Format a bucket bound the way Prometheus expects."""
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+REGISTRY = Registry()
+
+
+def enable(sample_rate=1.0):
+    """
+    Turns instrumentation on.
+
+    Only functions decorated after this call are instrumented, so call it
+    before importing the modules you want to measure.
+
+    Args:
+        sample_rate (float): Fraction of calls whose latency is timed.
+            Every call is still counted.
+    """
+    REGISTRY.sample_every = _sample_every(sample_rate)
+    REGISTRY.enabled = True
+
+
+def disable():
+    """Stops recording. Instrumented functions then skip straight to the original."""
+    REGISTRY.enabled = False
+
+
+# ============================================
+# DECORATOR
+# ============================================
+
+def instrument(func=None, name=None):
+    """
+    Decorator that records calls, errors and sampled latency of a function.
+
+    Can be used as @instrument or @instrument(name="custom.name").
+    When instrumentation is off at decoration time the function is
+    returned unchanged.
+    """
+    if func is None:
+        return lambda f: instrument(f, name)
+    if not REGISTRY.enabled:
+        return func
+
+    metric = REGISTRY.get(name or f"{func.__module__}.{func.__qualname__}")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not REGISTRY.enabled:
+            return func(*args, **kwargs)
+
+        metric.calls += 1
+        if metric.calls % REGISTRY.sample_every:
+            # Not sampled - only count calls and errors
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                metric.errors += 1
+                raise
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            metric.errors += 1
+            raise
+        finally:
+            metric.observe(time.perf_counter() - start)
+
+    return wrapper
+
+
+# ============================================
+# EXPORT
+# ============================================
+
+def to_prometheus(registry=REGISTRY):
+    """Return all metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP function_calls_total Number of calls.",
+        "# TYPE function_calls_total counter",
+    ]
+    snapshot = registry.snapshot()
+    for name, m in snapshot.items():
+        lines.append(f'function_calls_total{{function="{name}"}} {m["calls"]}')
+
+    lines += [
+        "# HELP function_errors_total Number of calls that raised an exception.",
+        "# TYPE function_errors_total counter",
+    ]
+    for name, m in snapshot.items():
+        lines.append(f'function_errors_total{{function="{name}"}} {m["errors"]}')
+
+    lines += [
+        "# HELP function_duration_seconds Latency of sampled calls.",
+        "# TYPE function_duration_seconds histogram",
+    ]
+    for name, m in snapshot.items():
+        cumulative = 0
+        for label, count in m["buckets"].items():
+            cumulative += count
+            lines.append(f'function_duration_seconds_bucket{{function="{name}",le="{label}"}} '
+                         f'{cumulative}')
+        lines.append(f'function_duration_seconds_sum{{function="{name}"}} {m["total_time"]}')
+        lines.append(f'function_duration_seconds_count{{function="{name}"}} {m["timed"]}')
+
+    return "\n".join(lines) + "\n"
+
+
+def export_metrics(path, registry=REGISTRY):
+    """
+    Writes a snapshot of all metrics to a local file.
+
+    Args:
+        path (str): Output file. A .json extension writes JSON,
+            anything else writes Prometheus text.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            json.dump({"timestamp": time.time(), "metrics": registry.snapshot()}, f, indent=2)
+        else:
+            f.write(to_prometheus(registry))
+
+
+if REGISTRY.enabled and os.environ.get("INSTRUMENTATION_EXPORT"):
+    atexit.register(export_metrics, os.environ["INSTRUMENTATION_EXPORT"])
+
+
+# ============================================
+# PROFILER
+# ============================================
+
+@contextlib.contextmanager
+def profile_action(label, directory=None):
+    """
+    Context manager that runs cProfile around one menu action.
+
+    Does nothing unless a directory is given or INSTRUMENTATION_PROFILE
+    is set. The stats are saved as <directory>/<label>-<nanoseconds>.prof
+    and the slowest calls are printed to stderr. A failure to save the
+    stats is reported but never raised, so profiling cannot stop the
+    program.
+
+    Args:
+        label (str): Name of the action, used in the file name. Characters
+            other than letters, digits, "-", "_" and "." are replaced.
+        directory (str): Folder for the .prof file.
+    """
+    directory = directory or REGISTRY.profile_dir
+    if not directory:
+        yield None
+        return
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        safe_label = re.sub(r"[^A-Za-z0-9_.-]", "_", label)
+        path = os.path.join(directory, f"{safe_label}-{time.time_ns()}.prof")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            profiler.dump_stats(path)
+            print(f"\n[profile] {label} -> {path}", file=sys.stderr)
+        except OSError as error:
+            print(f"\n[profile] could not save {label}: {error}", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(10)
@@ -0,0 +1,385 @@
+import csv
+import hashlib
+import os
+import time
+from collections import namedtuple
+
+# ============================================
+# INVENTORY CONFIGURATION CONSTANTS
+# ============================================
+
+INVENTORY_FILE = "inventory.csv"       # CSV file holding the inventory
+FIELDNAMES = ["name", "quantity", "price"]
+LOW_STOCK_THRESHOLD = 5                # Quantity at or below this is "low stock"
+POLL_INTERVAL = 2.0                    # Seconds between checks in watch mode
+BLOCK_SIZE = 65536                     # Bytes read at a time when checking a file
+
+# A single change to the inventory, sent to watch subscribers.
+# kind is "added", "changed" or "removed"; old/new are item dicts or None.
+ChangeEvent = namedtuple("ChangeEvent", ["kind", "name", "old", "new"])
+
+
+# ============================================
+# LOADING AND SAVING
+# ============================================
+
+def parse_row(row):
+    """
+    Converts one CSV row into an inventory item.
+
+    Args:
+        row (dict): A row from csv.DictReader.
+
+    Returns:
+        dict: The item with typed quantity and price, or None if the
+        row is blank or malformed.
+    """
+    try:
+        name = row["name"].strip()
+        if not name:
+            return None
+        return {
+            "name": name,
+            "quantity": int(row["quantity"]),
+            "price": float(row["price"]),
+        }
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def load_inventory(path=INVENTORY_FILE):
+    """
+    Loads the whole inventory file.
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Returns:
+        dict: Items keyed by name. Later rows win over earlier ones.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, newline="", encoding="utf-8") as f:
+        items, _ = parse_lines(f)
+    return items
+
+
+def save_inventory(items, path=INVENTORY_FILE):
+    """
+    Writes all items back to the CSV file.
+
+    Args:
+        items (dict): Items keyed by name.
+        path (str): Path to the CSV file.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, lineterminator="\n")
+        writer.writeheader()
+        for item in items.values():
+            writer.writerow(item)
+
+
+def parse_lines(lines, fieldnames=None):
+    """
+    Parses CSV lines into inventory items.
+
+    Args:
+        lines (list): Text lines, starting with a header unless
+            fieldnames is given.
+        fieldnames (list): Column names to use instead of a header line.
+
+    Returns:
+        tuple: (items keyed by name, the column names that were used).
+    """
+    items = {}
+    reader = csv.DictReader(lines, fieldnames=fieldnames)
+    for row in reader:
+        item = parse_row(row)
+        if item is not None:
+            items[item["name"]] = item
+    return items, reader.fieldnames
+
+
+def diff_inventory(old_items, new_items):
+    """
+    Compares two inventories by item name.
+
+    Args:
+        old_items (dict): The inventory before the change.
+        new_items (dict): The inventory after the change.
+
+    Returns:
+        list: ChangeEvent objects for every added, changed or removed item.
+    """
+    events = []
+    for name, new in new_items.items():
+        old = old_items.get(name)
+        if old is None:
+            events.append(ChangeEvent("added", name, None, new))
+        elif old != new:
+            events.append(ChangeEvent("changed", name, old, new))
+    for name, old in old_items.items():
+        if name not in new_items:
+            events.append(ChangeEvent("removed", name, old, None))
+    return events
+
+
+# ============================================
+# WATCH / INCREMENTAL RELOAD
+# ============================================
+
+class InventoryWatcher:
+    """
+    Keeps an in-memory inventory in sync with a CSV file by polling.
+
+    Each poll compares the file's size and mtime with the last check.
+    If the file grew, the part already read is hashed (not parsed) and
+    compared with the hash taken last time; if it matches, just the new
+    tail is parsed. Anything else is treated as a rewrite: the file is
+    re-parsed and only the rows that differ are applied.
+    Subscribers get a list of ChangeEvent objects instead of a snapshot.
+    """
+
+    def __init__(self, path=INVENTORY_FILE):
+        """Load the file and remember where we stopped reading."""
+        self.path = path
+        self.items = {}
+        self.low_stock = set()     # Index: names at or below LOW_STOCK_THRESHOLD
+        self.subscribers = []
+
+        self._stat = None          # (inode, size, mtime_ns) at last poll
+        self._offset = 0           # Byte offset just after the last full line
+        self._digest = None        # Hash of the bytes before _offset
+        self._header = FIELDNAMES
+
+        self._apply(self._full_reload())
+
+    def subscribe(self, callback):
+        """Register callback(events) to be called when items change."""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop sending events to callback."""
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def poll(self):
+        """
+        Checks the file once and applies any changes.
+
+        Returns:
+            list: The ChangeEvent objects that were applied (may be empty).
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # The upstream job may be midway through replacing the file
+            return []
+
+        stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if stat_key == self._stat:
+            return []
+
+        events = self._read_tail() if self._may_be_append(st) else None
+        if events is None:
+            events = self._full_reload()
+
+        self._apply(events)
+        return events
+
+    def watch(self, interval=POLL_INTERVAL, stop=None):
+        """
+        Polls forever (or until stop() returns True).
+
+        Args:
+            interval (float): Seconds to sleep between polls.
+            stop (callable): Optional function checked after each poll.
+        """
+        while True:
+            self.poll()
+            if stop is not None and stop():
+                break
+            time.sleep(interval)
+
+    def _may_be_append(self, st):
+        """Return True if the stat result allows the file to be the old one plus data."""
+        if self._stat is None or self._digest is None:
+            return False
+        return st.st_ino == self._stat[0] and st.st_size > self._stat[1]
+
+    def _read_tail(self):
+        """
+        Parse only the rows after the last offset.
+
+        Returns:
+            list: ChangeEvent objects, or None if the bytes already read
+            have changed and the file needs a full reload.
+        """
+        digest = hashlib.sha1()
+        with open(self.path, "rb") as f:
+            remaining = self._offset
+            while remaining:
+                block = f.read(min(remaining, BLOCK_SIZE))
+                if not block:
+                    return None
+                digest.update(block)
+                remaining -= len(block)
+            if digest.digest() != self._digest.digest():
+                return None
+
+            data = f.read()
+            st = os.fstat(f.fileno())
+
+        # Leave any half-written last line for the next poll
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8").splitlines()
+
+        new_items, _ = parse_lines(lines, self._header)
+        # Appended rows can only add or change items, never remove them
+        old_items = {name: self.items[name] for name in new_items if name in self.items}
+        events = diff_inventory(old_items, new_items)
+
+        digest.update(data[:end])
+        self._remember_position(st, self._offset + end, digest)
+        return events
+
+    def _full_reload(self):
+        """Re-parse the whole file and diff it against memory."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
+        except FileNotFoundError:
+            return []
+
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8").splitlines()
+
+        new_items, fieldnames = parse_lines(lines)
+        if fieldnames:
+            self._header = fieldnames
+
+        self._remember_position(st, end, hashlib.sha1(data[:end]))
+        return diff_inventory(self.items, new_items)
+
+    def _remember_position(self, st, offset, digest):
+        """Store the stat key, offset and hash of the applied bytes for the next poll."""
+        self._stat = (st.st_ino, st.st_size, st.st_mtime_ns)
+        self._offset = offset
+        self._digest = digest
+
+    def _apply(self, events):
+        """Apply events to the items and index, then notify subscribers."""
+        if not events:
+            return
+
+        for event in events:
+            if event.kind == "removed":
+                del self.items[event.name]
+                self.low_stock.discard(event.name)
+            else:
+                self.items[event.name] = event.new
+                if event.new["quantity"] <= LOW_STOCK_THRESHOLD:
+                    self.low_stock.add(event.name)
+                else:
+                    self.low_stock.discard(event.name)
+
+        for callback in list(self.subscribers):
+            callback(events)
+
+
+def print_events(events):
+    """Prints change events in a readable form."""
+    for event in events:
+        if event.kind == "added":
+            print(f"+ {event.name}: qty {event.new['quantity']}, "
+                  f"price {event.new['price']:.2f}")
+        elif event.kind == "removed":
+            print(f"- {event.name}")
+        else:
+            print(f"~ {event.name}: qty {event.old['quantity']} -> "
+                  f"{event.new['quantity']}, price {event.old['price']:.2f} -> "
+                  f"{event.new['price']:.2f}")
+
+
+# ============================================
+# MENU ACTIONS
+# ============================================
+
+def display_inventory(items):
+    """Displays all items as a table."""
+    if not items:
+        print("\nInventory is empty.")
+        return
+
+    print(f"\n{'Name':<20}{'Qty':>8}{'Price':>12}")
+    print("-" * 40)
+    for item in items.values():
+        print(f"{item['name']:<20}{item['quantity']:>8}{item['price']:>12.2f}")
+
+
+def add_item(items, name, quantity, price):
+    """Adds a new item or replaces an existing one."""
+    name = name.strip()
+    if not name:
+        print("Error: Item name cannot be empty.")
+        return
+    items[name] = {"name": name, "quantity": quantity, "price": price}
+    print(f"Item '{name}' saved!")
+
+
+def remove_item(items, name):
+    """Removes an item by name."""
+    if items.pop(name.strip(), None) is not None:
+        print(f"Item '{name}' removed!")
+    else:
+        print("Error: Item not found.")
+
+
+def watch_inventory(path=INVENTORY_FILE, interval=POLL_INTERVAL):
+    """Prints changes to the inventory file until Ctrl+C is pressed."""
+    watcher = InventoryWatcher(path)
+    watcher.subscribe(print_events)
+    print(f"\nWatching {path} ({len(watcher.items)} items). Press Ctrl+C to stop.")
+    try:
+        watcher.watch(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def main(path=INVENTORY_FILE):
+    """Main function - runs the program on the inventory file at path."""
+    print("\n=== INVENTORY MANAGER ===")
+    items = load_inventory(path)
+
+    while True:
+        print("\n1. View  2. Add/Update  3. Remove  4. Watch file  5. Exit")
+        choice = input("Choice: ").strip()
+
+        if choice == "1":
+            display_inventory(items)
+        elif choice == "2":
+            try:
+                name = input("Item name: ")
+                quantity = int(input("Quantity: "))
+                price = float(input("Price: "))
+                add_item(items, name, quantity, price)
+                save_inventory(items, path)
+            except ValueError:
+                print("Enter a valid number.")
+        elif choice == "3":
+            remove_item(items, input("Item name: "))
+            save_inventory(items, path)
+        elif choice == "4":
+            watch_inventory(path)
+            items = load_inventory(path)
+        elif choice == "5":
+            print("Goodbye!")
+            break
+        else:
+            print("Invalid choice.")
+
+
+if __name__ == "__main__":
+    main()
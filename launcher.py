@@ -0,0 +1,186 @@
+"""
+Single entry point for every program in this repository.
+
+Each subcommand imports its program only when it is chosen, so starting
+the launcher never pays for another program's imports. tkinter is only
+loaded by "todo --gui" and NumPy only by the rectangle bulk mode.
+
+Examples:
+    python launcher.py fibonacci
+    python launcher.py todo --gui
+    python launcher.py rectangle --bulk sizes.csv -o areas.csv
+    python launcher.py --import-profile
+    python launcher.py --metrics metrics.prom todo
+"""
+
+import argparse
+import atexit
+import importlib
+import os
+import sys
+import time
+
+# Subcommand -> (modules it imports, help text).
+# Modules are only imported when the subcommand runs.
+PROGRAMS = {
+    "fibonacci": (["fibonacci_recursion"], "Fibonacci calculator"),
+    "guess": (["guess_number_loops"], "Simple guess-the-number game"),
+    "guessing-game": (["number_guessing_game"], "Full number guessing game"),
+    "todo": (["todo_list_functions"], "To-do list (use --gui for the window)"),
+    "inventory": (["inventory_manager"], "Inventory manager"),
+    "rectangle": (["rectangle_area"], "Rectangle area calculator"),
+}
+
+GUI_MODULES = ["todo_gui"]
+
+
+# ============================================
+# IMPORT PROFILING
+# ============================================
+
+def profile_imports(module_names):
+    """
+    Imports modules one at a time and measures what each one costs.
+
+    A module's cost includes any dependencies it is the first to load,
+    so the order of module_names matters.
+
+    Returns:
+        list: (module name, seconds, number of newly loaded modules) tuples.
+    """
+    results = []
+    for name in module_names:
+        before = len(sys.modules)
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError as error:
+            print(f"Could not import {name}: {error}", file=sys.stderr)
+            continue
+        elapsed = time.perf_counter() - start
+        results.append((name, elapsed, len(sys.modules) - before))
+    return results
+
+
+def print_import_profile(results, budget_ms=None):
+    """
+    Prints an import profile table to stderr.
+
+    Returns:
+        bool: False if a budget was given and the total exceeded it.
+    """
+    out = sys.stderr
+    print(f"\n{'Module':<24}{'Time (ms)':>12}{'New modules':>14}", file=out)
+    print("-" * 50, file=out)
+    total = 0.0
+    for name, seconds, loaded in results:
+        total += seconds
+        print(f"{name:<24}{seconds * 1000:>12.2f}{loaded:>14}", file=out)
+    print("-" * 50, file=out)
+    print(f"{'Total':<24}{total * 1000:>12.2f}", file=out)
+
+    if budget_ms is not None and total * 1000 > budget_ms:
+        print(f"Import time is over the {budget_ms:g} ms budget!", file=out)
+        return False
+    return True
+
+
+# ============================================
+# SUBCOMMANDS
+# ============================================
+
+def modules_for(args):
+    """Return the modules the chosen subcommand needs."""
+    if args.command == "todo" and args.gui:
+        return GUI_MODULES
+    return PROGRAMS[args.command][0]
+
+
+def run_program(args):
+    """Import and run the chosen program. Returns an exit code."""
+    module = importlib.import_module(modules_for(args)[0])
+
+    if args.command == "inventory":
+        if not args.watch:
+            module.main(args.file)
+        elif args.interval is None:
+            module.watch_inventory(args.file)
+        else:
+            module.watch_inventory(args.file, args.interval)
+        return 0
+    if args.command == "rectangle":
+        return module.main(args.args, prog=f"{os.path.basename(sys.argv[0])} rectangle")
+
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+def build_parser():
+    """Create the argument parser with one subparser per program."""
+    parser = argparse.ArgumentParser(description="Launch any program in this repository")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="report how long each module takes to import")
+    parser.add_argument("--import-budget", type=float, metavar="MS",
+                        help="with --import-profile, fail if imports take longer than MS")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="record metrics for instrumented functions and write them "
+                             "to FILE on exit (.json for JSON, else Prometheus text)")
+    parser.add_argument("--sample-rate", type=float, default=1.0,
+                        help="with --metrics, fraction of calls to time (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    for name, (_, help_text) in PROGRAMS.items():
+        if name == "rectangle":
+            # Options, including -h, are handled by rectangle_area.main()
+            subparsers.add_parser(name, help=help_text, add_help=False)
+            continue
+
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == "todo":
+            sub.add_argument("--gui", action="store_true", help="open the tkinter window")
+        elif name == "inventory":
+            sub.add_argument("--watch", action="store_true",
+                             help="print changes to the inventory file as they happen")
+            # Same as inventory_manager.INVENTORY_FILE, which is not imported here
+            sub.add_argument("--file", default="inventory.csv",
+                             help="inventory file to manage or watch (default: %(default)s)")
+            # None lets watch_inventory() apply its own POLL_INTERVAL default
+            sub.add_argument("--interval", type=float, default=None,
+                             help="with --watch, seconds between checks")
+    return parser
+
+
+def main(argv=None):
+    """Main function - parses arguments and runs the chosen program."""
+    parser = build_parser()
+    # Unknown arguments are passed through to rectangle_area.py
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "rectangle":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.args = extra
+
+    if not 0 < args.sample_rate <= 1:
+        parser.error("--sample-rate must be between 0 and 1")
+    if args.metrics:
+        # Must happen before the program is imported so its functions get wrapped
+        import instrumentation
+        instrumentation.enable(args.sample_rate)
+        atexit.register(instrumentation.export_metrics, args.metrics)
+
+    if args.import_profile:
+        if args.command is None:
+            names = [m for modules, _ in PROGRAMS.values() for m in modules] + GUI_MODULES
+        else:
+            names = modules_for(args)
+        within_budget = print_import_profile(profile_imports(names), args.import_budget)
+        if args.command is None or not within_budget:
+            return 0 if within_budget else 1
+    elif args.command is None:
+        parser.print_help()
+        return 1
+
+    return run_program(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ import random  # Used to generate random numbers
 import time    # Used to add delays for better user experience
 import os      # Used to clear the terminal screen
 
+from instrumentation import instrument  # Opt-in metrics for hot functions
+
 # ============================================
 # GAME CONFIGURATION CONSTANTS
 # ============================================
@@ -78,6 +80,7 @@ def generate_secret_number():
     return secret
 
 
+@instrument
 def get_player_guess(attempt_number):
     """
     Prompts the player for their guess and validates the input.
@@ -111,6 +114,7 @@ def get_player_guess(attempt_number):
         return None
 
 
+@instrument
 def provide_hint(guess, secret_number):
     """
     Provides a hint to the player based on their guess.
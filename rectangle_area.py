@@ -1,11 +1,571 @@
-# Get length from user
-length = float(input("Enter the length of the rectangle: "))
+import argparse
+import functools
+import math
+import random
+import statistics
+import sys
+import time
+from array import array
+from collections import namedtuple
 
-# Get width from user
-width = float(input("Enter the width of the rectangle: "))
+# Number of rectangles processed at a time in bulk mode
+CHUNK_SIZE = 65536
 
-# Calculate area
-area = length * width
 
-# Display the result
-print(f"The area of the rectangle is: {area}")
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """
+    Imports NumPy the first time bulk mode needs it.
+
+    NumPy is optional and slow to import, so the single-rectangle mode
+    never loads it.
+
+    Returns:
+        module: The numpy module, or None if it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def calculate_area(length, width):
+    """
+    Calculates the area of a rectangle.
+
+    Args:
+        length (float): Length of the rectangle.
+        width (float): Width of the rectangle.
+
+    Returns:
+        float: The area (length * width).
+
+    Raises:
+        ValueError: If a dimension is negative or not a finite number.
+    """
+    for value in (length, width):
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(f"Invalid dimension: {value}")
+    return length * width
+
+
+# ============================================
+# BULK MODE - READING
+# ============================================
+
+def _is_number(text):
+    """Return True if text can be converted to a float."""
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+
+def read_csv_chunks(stream, chunk_size=CHUNK_SIZE):
+    """
+    Reads "length,width" lines from a text stream in chunks.
+
+    Blank lines are skipped, and so is the first non-blank line if none
+    of its fields is a number (a header). Any other line that is not
+    exactly two numbers is an error.
+
+    Yields:
+        tuple: (lengths, widths) lists of floats for each chunk.
+    """
+    lengths, widths = [], []
+    first_line = True
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        fields = line.split(",")
+        try:
+            length, width = fields
+            length, width = float(length), float(width)
+        except ValueError:
+            if first_line and not any(_is_number(f) for f in fields):
+                first_line = False
+                continue  # Header row
+            raise ValueError(f"Line {line_number}: cannot parse {line!r}")
+        first_line = False
+        lengths.append(length)
+        widths.append(width)
+
+        if len(lengths) >= chunk_size:
+            yield lengths, widths
+            lengths, widths = [], []
+
+    if lengths:
+        yield lengths, widths
+
+
+def read_binary_chunks(stream, chunk_size=CHUNK_SIZE):
+    """
+    Reads pairs of native float64 values (length, width) from a binary stream.
+
+    Yields:
+        tuple: (lengths, widths) sequences for each chunk.
+    """
+    np = _numpy()
+    record_size = 2 * 8
+    leftover = b""
+    while True:
+        data = stream.read(chunk_size * record_size)
+        if not data:
+            break
+        data = leftover + data
+        usable = len(data) - len(data) % record_size
+        leftover = data[usable:]
+
+        if np is not None:
+            pairs = np.frombuffer(data[:usable], dtype=np.float64).reshape(-1, 2)
+            yield pairs[:, 0], pairs[:, 1]
+        else:
+            values = array("d")
+            values.frombytes(data[:usable])
+            yield values[0::2], values[1::2]
+
+    if leftover:
+        raise ValueError("Binary input ends with an incomplete record")
+
+
+# ============================================
+# BULK MODE - COMPUTING AND WRITING
+# ============================================
+
+def compute_areas(lengths, widths, start=0):
+    """
+    Calculates the areas for a chunk of rectangles.
+
+    Uses NumPy vectorization when available, otherwise a plain loop.
+
+    Args:
+        lengths (sequence): Rectangle lengths.
+        widths (sequence): Rectangle widths, same size as lengths.
+        start (int): Index of the chunk's first rectangle in the whole
+            input, used in error messages.
+
+    Returns:
+        numpy.ndarray or array.array: The areas as float64.
+
+    Raises:
+        ValueError: If any dimension is negative or not finite.
+    """
+    np = _numpy()
+    if np is not None:
+        lengths = np.asarray(lengths, dtype=np.float64)
+        widths = np.asarray(widths, dtype=np.float64)
+        valid = np.isfinite(lengths) & np.isfinite(widths) & (lengths >= 0) & (widths >= 0)
+        if not valid.all():
+            bad = int(np.argmin(valid))
+            raise ValueError(
+                f"Invalid dimensions for rectangle {start + bad}: "
+                f"{lengths[bad]}, {widths[bad]}"
+            )
+        return lengths * widths
+
+    areas = array("d")
+    for row, (length, width) in enumerate(zip(lengths, widths)):
+        try:
+            areas.append(calculate_area(length, width))
+        except ValueError:
+            raise ValueError(
+                f"Invalid dimensions for rectangle {start + row}: {length}, {width}"
+            )
+    return areas
+
+
+def bulk_areas(source, destination, binary=False, chunk_size=CHUNK_SIZE):
+    """
+    Streams rectangles from source and writes their areas to destination.
+
+    Only one chunk is held in memory at a time, so memory use stays
+    constant regardless of input size.
+
+    Args:
+        source: A text stream (CSV) or binary stream (binary=True).
+        destination: A text stream for CSV output, or binary stream for
+            float64 output when binary=True.
+        binary (bool): Use raw float64 input and output instead of CSV.
+        chunk_size (int): Number of rectangles per chunk.
+
+    Returns:
+        int: The number of rectangles processed.
+    """
+    reader = read_binary_chunks if binary else read_csv_chunks
+    count = 0
+    for lengths, widths in reader(source, chunk_size):
+        areas = compute_areas(lengths, widths, count)
+
+        if binary:
+            destination.write(areas.tobytes())
+        else:
+            destination.write("\n".join(map(repr, areas.tolist())))
+            destination.write("\n")
+        count += len(areas)
+    return count
+
+
+# ============================================
+# POSITIONED RECTANGLES
+# ============================================
+
+# An axis-aligned rectangle given by its lower-left (x1, y1) and
+# upper-right (x2, y2) corners.
+Rect = namedtuple("Rect", ["x1", "y1", "x2", "y2"])
+
+
+def make_rect(x, y, length, width):
+    """
+    Creates a positioned rectangle from its lower-left corner and size.
+
+    Raises:
+        ValueError: If a dimension is negative or not a finite number.
+    """
+    calculate_area(length, width)  # Validates the dimensions
+    return Rect(x, y, x + length, y + width)
+
+
+def rect_area(rect):
+    """Returns the area of a positioned rectangle."""
+    return calculate_area(rect.x2 - rect.x1, rect.y2 - rect.y1)
+
+
+def rects_overlap(a, b):
+    """Returns True if two rectangles share a region of positive area."""
+    return a.x1 < b.x2 and b.x1 < a.x2 and a.y1 < b.y2 and b.y1 < a.y2
+
+
+def rect_contains(rect, x, y):
+    """Returns True if point (x, y) lies inside or on the edge of rect."""
+    return rect.x1 <= x <= rect.x2 and rect.y1 <= y <= rect.y2
+
+
+class CoverageTree:
+    """
+    Segment tree over compressed y coordinates for the union-area sweep.
+
+    Each node stores how many rectangles fully cover its interval and the
+    total covered length beneath it, so adding or removing an interval
+    and reading the covered length are both O(log n).
+    """
+
+    def __init__(self, ys):
+        """Build an empty tree over the sorted unique coordinates ys."""
+        self.ys = ys
+        size = 4 * max(1, len(ys) - 1)
+        self.count = [0] * size
+        self.covered = [0.0] * size
+
+    def update(self, lo, hi, delta, node=1, left=0, right=None):
+        """Add delta coverage to the elementary intervals [lo, hi)."""
+        if right is None:
+            right = len(self.ys) - 1
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self.count[node] += delta
+        else:
+            mid = (left + right) // 2
+            self.update(lo, hi, delta, 2 * node, left, mid)
+            self.update(lo, hi, delta, 2 * node + 1, mid, right)
+
+        if self.count[node] > 0:
+            self.covered[node] = self.ys[right] - self.ys[left]
+        elif right - left == 1:
+            self.covered[node] = 0.0
+        else:
+            self.covered[node] = self.covered[2 * node] + self.covered[2 * node + 1]
+
+    def total(self):
+        """Return the total length currently covered."""
+        return self.covered[1]
+
+
+def union_area(rects):
+    """
+    Calculates the total area covered by rectangles (overlaps counted once).
+
+    Sweeps a vertical line across the x axis. Each rectangle adds its
+    y interval to a CoverageTree when the line reaches x1 and removes it
+    at x2; the area between two events is the covered length times the
+    distance moved. Runs in O(n log n).
+
+    Args:
+        rects (iterable): Rect objects.
+
+    Returns:
+        float: The area of the union.
+    """
+    events = []
+    ys = set()
+    for r in rects:
+        if r.x1 < r.x2 and r.y1 < r.y2:
+            events.append((r.x1, 1, r.y1, r.y2))
+            events.append((r.x2, -1, r.y1, r.y2))
+            ys.add(r.y1)
+            ys.add(r.y2)
+    if not events:
+        return 0.0
+
+    events.sort()
+    ys = sorted(ys)
+    y_index = {y: i for i, y in enumerate(ys)}
+    tree = CoverageTree(ys)
+
+    area = 0.0
+    last_x = events[0][0]
+    for x, delta, y1, y2 in events:
+        area += tree.total() * (x - last_x)
+        tree.update(y_index[y1], y_index[y2], delta)
+        last_x = x
+    return area
+
+
+class GridIndex:
+    """
+    Uniform grid spatial index for overlap and point queries.
+
+    Every rectangle is stored in each grid cell it touches. Queries only
+    look at the cells they touch, so with a cell size close to the
+    typical rectangle size they check a handful of candidates instead of
+    every rectangle. Rectangles that would touch more than
+    MAX_CELLS_PER_RECT cells are kept in a separate list that every
+    query checks, so a few huge rectangles cannot blow up the grid.
+    """
+
+    MAX_CELLS_PER_RECT = 64
+
+    def __init__(self, rects, cell_size=None):
+        """
+        Index rects.
+
+        Args:
+            rects (list): Rect objects. Query results are indexes into it.
+            cell_size (float): Grid spacing. Defaults to the median
+                rectangle side length.
+        """
+        self.rects = list(rects)
+        if cell_size is None:
+            sides = [r.x2 - r.x1 for r in self.rects] + [r.y2 - r.y1 for r in self.rects]
+            cell_size = statistics.median(sides) if sides else 1.0
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self.cells = {}
+        self.large = []     # Indexes of rectangles too big for the grid
+
+        for i, r in enumerate(self.rects):
+            if self._cell_count(r) > self.MAX_CELLS_PER_RECT:
+                self.large.append(i)
+                continue
+            for cell in self._cells_for(r):
+                self.cells.setdefault(cell, []).append(i)
+
+    def _cell(self, x, y):
+        """Return the grid cell containing point (x, y)."""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _cell_count(self, r):
+        """Return how many grid cells rectangle r touches."""
+        cx1, cy1 = self._cell(r.x1, r.y1)
+        cx2, cy2 = self._cell(r.x2, r.y2)
+        return (cx2 - cx1 + 1) * (cy2 - cy1 + 1)
+
+    def _cells_for(self, r):
+        """Yield every grid cell touched by rectangle r."""
+        cx1, cy1 = self._cell(r.x1, r.y1)
+        cx2, cy2 = self._cell(r.x2, r.y2)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                yield (cx, cy)
+
+    def query_point(self, x, y):
+        """Return the indexes of rectangles containing point (x, y)."""
+        found = [i for i in self.cells.get(self._cell(x, y), ())
+                 if rect_contains(self.rects[i], x, y)]
+        found += [i for i in self.large if rect_contains(self.rects[i], x, y)]
+        return sorted(found)
+
+    def query_overlaps(self, rect):
+        """Return the indexes of rectangles overlapping rect."""
+        if self._cell_count(rect) > len(self.cells):
+            # Visiting every occupied cell is cheaper than every touched cell
+            candidates = (i for members in self.cells.values() for i in members)
+        else:
+            candidates = (i for cell in self._cells_for(rect)
+                          for i in self.cells.get(cell, ()))
+
+        found = {i for i in candidates if rects_overlap(self.rects[i], rect)}
+        found.update(i for i in self.large if rects_overlap(self.rects[i], rect))
+        return sorted(found)
+
+    def overlapping_pairs(self):
+        """
+        Return every pair (i, j), i < j, of overlapping rectangles.
+
+        A pair in the grid is reported only from the cell holding the
+        lower-left corner of its intersection, so it is never counted
+        twice. Large rectangles are checked against every rectangle.
+        """
+        pairs = []
+        for cell, members in self.cells.items():
+            for a in range(len(members)):
+                ra = self.rects[members[a]]
+                for b in range(a + 1, len(members)):
+                    rb = self.rects[members[b]]
+                    if not rects_overlap(ra, rb):
+                        continue
+                    if self._cell(max(ra.x1, rb.x1), max(ra.y1, rb.y1)) == cell:
+                        i, j = members[a], members[b]
+                        pairs.append((i, j) if i < j else (j, i))
+
+        large = set(self.large)
+        for i in self.large:
+            for j, r in enumerate(self.rects):
+                # Pairs of two large rectangles are reported once, from the lower index
+                if j == i or (j in large and j < i):
+                    continue
+                if rects_overlap(self.rects[i], r):
+                    pairs.append((i, j) if i < j else (j, i))
+        return pairs
+
+
+# ============================================
+# BRUTE FORCE AND BENCHMARK
+# ============================================
+
+def brute_force_pairs(rects):
+    """Return overlapping pairs by checking every pair - O(n^2)."""
+    return [(i, j) for i in range(len(rects)) for j in range(i + 1, len(rects))
+            if rects_overlap(rects[i], rects[j])]
+
+
+def brute_force_point(rects, x, y):
+    """Return rectangles containing (x, y) by checking every one - O(n)."""
+    return [i for i, r in enumerate(rects) if rect_contains(r, x, y)]
+
+
+def random_rects(count, world=1000.0, max_size=10.0, seed=0):
+    """Generate count random rectangles inside a square world."""
+    rng = random.Random(seed)
+    rects = []
+    for _ in range(count):
+        x = rng.uniform(0, world)
+        y = rng.uniform(0, world)
+        rects.append(make_rect(x, y, rng.uniform(0, max_size), rng.uniform(0, max_size)))
+    return rects
+
+
+def run_benchmark(count, queries=1000, brute_limit=5000):
+    """
+    Times the grid index and sweep line against brute force and prints them.
+
+    Above brute_limit rectangles the brute force pair check is skipped and
+    only a few point queries are compared, since they would take too long.
+    """
+    rects = random_rects(count)
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(queries)]
+
+    def timed(label, func):
+        start = time.perf_counter()
+        result = func()
+        print(f"{label:<28}{time.perf_counter() - start:>10.4f} s")
+        return result
+
+    print(f"\n{count} rectangles, {queries} point queries")
+    print("-" * 38)
+    area = timed("union area (sweep line)", lambda: union_area(rects))
+    index = timed("build grid index", lambda: GridIndex(rects))
+    pairs = timed("overlapping pairs (grid)", index.overlapping_pairs)
+    hits = timed("point queries (grid)",
+                 lambda: [index.query_point(x, y) for x, y in points])
+    # Check fewer points against brute force on large inputs
+    checked = points if count <= brute_limit else points[:10]
+    brute_hits = timed(f"point queries (brute, {len(checked)})",
+                       lambda: [brute_force_point(rects, x, y) for x, y in checked])
+    if hits[:len(checked)] != brute_hits:
+        raise AssertionError("Grid and brute force point queries disagree")
+
+    if count <= brute_limit:
+        brute_pairs = timed("overlapping pairs (brute)", lambda: brute_force_pairs(rects))
+        if sorted(pairs) != brute_pairs:
+            raise AssertionError("Grid and brute force overlap pairs disagree")
+
+    print("-" * 38)
+    print(f"Union area: {area:.2f} | Overlapping pairs: {len(pairs)}")
+
+
+# ============================================
+# COMMAND LINE
+# ============================================
+
+def run_bulk(args):
+    """Open the files named on the command line and run bulk mode."""
+    mode = "b" if args.binary else ""
+    source = destination = None
+    try:
+        if args.input == "-":
+            source = sys.stdin.buffer if args.binary else sys.stdin
+        else:
+            source = open(args.input, "r" + mode)
+        if args.output == "-":
+            destination = sys.stdout.buffer if args.binary else sys.stdout
+        else:
+            destination = open(args.output, "w" + mode)
+
+        count = bulk_areas(source, destination, args.binary, args.chunk_size)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not None and source not in (sys.stdin, sys.stdin.buffer):
+            source.close()
+        if destination is not None and destination not in (sys.stdout, sys.stdout.buffer):
+            destination.close()
+
+    print(f"Processed {count} rectangles.", file=sys.stderr)
+    return 0
+
+
+def main(argv=None, prog=None):
+    """Main function - asks for one rectangle, or runs bulk mode."""
+    parser = argparse.ArgumentParser(prog=prog, description="Rectangle area calculator")
+    parser.add_argument("--bulk", dest="input", metavar="FILE",
+                        help="read length,width rows from FILE ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="where to write areas (default: stdout)")
+    parser.add_argument("--binary", action="store_true",
+                        help="read and write raw float64 values instead of CSV")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="rectangles per chunk (default: %(default)s)")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="time the spatial index and union area on N "
+                             "random rectangles against brute force")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if args.benchmark is not None:
+        run_benchmark(args.benchmark)
+        return 0
+    if args.input is not None:
+        return run_bulk(args)
+
+    try:
+        # Get length and width from user
+        length = float(input("Enter the length of the rectangle: "))
+        width = float(input("Enter the width of the rectangle: "))
+
+        # Calculate and display the area
+        area = calculate_area(length, width)
+        print(f"The area of the rectangle is: {area}")
+    except ValueError as error:
+        print(f"Error: {error}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
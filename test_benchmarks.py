@@ -0,0 +1,66 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import compare_results, main
+
+
+def result(median):
+    """Return a minimal results entry with the given median time."""
+    return {"median": median}
+
+
+class CompareResultsTest(unittest.TestCase):
+    """Tests for the regression gate."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, results):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f)
+        return path
+
+    def compare(self, *args):
+        """Run 'benchmarks.py compare' quietly and return its exit code."""
+        with contextlib.redirect_stdout(io.StringIO()), \
+             contextlib.redirect_stderr(io.StringIO()):
+            return main(["compare", *args])
+
+    def test_regression_over_threshold_is_flagged(self):
+        baseline = {"a": result(1.0), "b": result(1.0)}
+        current = {"a": result(1.05), "b": result(1.2)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            regressions = compare_results(baseline, current, threshold=0.1)
+        self.assertEqual(regressions, [("b", 1.0, 1.2)])
+
+    def test_exit_codes(self):
+        baseline = self.write("base.json", {"a": result(1.0)})
+        faster = self.write("faster.json", {"a": result(0.9)})
+        slower = self.write("slower.json", {"a": result(2.0)})
+        self.assertEqual(self.compare(baseline, faster), 0)
+        self.assertEqual(self.compare(baseline, slower), 1)
+
+    def test_no_shared_benchmarks_fails(self):
+        baseline = self.write("base.json", {"a": result(1.0)})
+        other = self.write("other.json", {"b": result(1.0)})
+        self.assertEqual(self.compare(baseline, other), 1)
+
+    def test_missing_or_malformed_baseline_fails(self):
+        current = self.write("current.json", {"a": result(1.0)})
+        broken = os.path.join(self.tmp.name, "broken.json")
+        with open(broken, "w", encoding="utf-8") as f:
+            f.write("not json")
+        self.assertEqual(self.compare(os.path.join(self.tmp.name, "nope.json"), current), 1)
+        self.assertEqual(self.compare(broken, current), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
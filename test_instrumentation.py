@@ -0,0 +1,121 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import instrumentation
+from instrumentation import (REGISTRY, Registry, export_metrics, instrument, profile_action,
+                             to_prometheus)
+
+
+class InstrumentTest(unittest.TestCase):
+    """Tests for the @instrument decorator."""
+
+    def setUp(self):
+        self.saved = (REGISTRY.enabled, REGISTRY.sample_every)
+
+    def tearDown(self):
+        REGISTRY.enabled, REGISTRY.sample_every = self.saved
+
+    def test_disabled_returns_same_function(self):
+        instrumentation.disable()
+
+        def func():
+            return 1
+        self.assertIs(instrument(func), func)
+        self.assertIs(instrument(name="test.named")(func), func)
+
+    def test_sampling_times_one_call_in_n(self):
+        instrumentation.enable(sample_rate=0.25)
+        func = instrument(lambda: None, name="test.sampling")
+        for _ in range(8):
+            func()
+
+        metric = REGISTRY.metrics["test.sampling"]
+        self.assertEqual(metric.calls, 8)
+        self.assertEqual(metric.timed, 2)
+        self.assertEqual(sum(metric.buckets), 2)
+
+    def test_errors_are_counted_and_raised(self):
+        instrumentation.enable(sample_rate=0.5)
+
+        @instrument(name="test.errors")
+        def fail():
+            raise ValueError("boom")
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                fail()
+        metric = REGISTRY.metrics["test.errors"]
+        self.assertEqual((metric.calls, metric.errors, metric.timed), (3, 3, 1))
+
+    def test_disable_after_decoration_skips_recording(self):
+        instrumentation.enable()
+        func = instrument(lambda: 5, name="test.disable")
+        instrumentation.disable()
+        self.assertEqual(func(), 5)
+        self.assertEqual(REGISTRY.metrics["test.disable"].calls, 0)
+
+
+class ExportTest(unittest.TestCase):
+    """Tests for Prometheus and JSON export."""
+
+    def setUp(self):
+        self.registry = Registry()
+        metric = self.registry.get("demo")
+        metric.calls, metric.errors = 4, 1
+        for seconds in (0.00005, 0.003, 100.0):
+            metric.observe(seconds)
+
+    def test_prometheus_buckets_are_cumulative(self):
+        lines = to_prometheus(self.registry).splitlines()
+        for line in ('function_calls_total{function="demo"} 4',
+                     'function_errors_total{function="demo"} 1',
+                     'function_duration_seconds_bucket{function="demo",le="1e-05"} 0',
+                     'function_duration_seconds_bucket{function="demo",le="0.0001"} 1',
+                     'function_duration_seconds_bucket{function="demo",le="0.001"} 1',
+                     'function_duration_seconds_bucket{function="demo",le="0.005"} 2',
+                     'function_duration_seconds_bucket{function="demo",le="5.0"} 2',
+                     'function_duration_seconds_bucket{function="demo",le="+Inf"} 3',
+                     'function_duration_seconds_count{function="demo"} 3'):
+            self.assertIn(line, lines)
+
+    def test_export_format_follows_extension(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "metrics.json")
+            prom_path = os.path.join(tmp, "metrics.prom")
+            export_metrics(json_path, self.registry)
+            export_metrics(prom_path, self.registry)
+
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["metrics"]["demo"]["calls"], 4)
+            self.assertEqual(data["metrics"]["demo"]["buckets"]["+Inf"], 1)
+            with open(prom_path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), to_prometheus(self.registry))
+
+
+class ProfileActionTest(unittest.TestCase):
+    """Tests for the per-action profiler."""
+
+    def test_label_is_sanitized(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+             contextlib.redirect_stderr(io.StringIO()):
+            with profile_action("todo-a/b", tmp):
+                sum(range(10))
+            files = os.listdir(tmp)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith("todo-a_b-"))
+
+    def test_save_failure_does_not_raise(self):
+        with tempfile.NamedTemporaryFile() as blocker, \
+             contextlib.redirect_stderr(io.StringIO()) as err:
+            with profile_action("todo-add", os.path.join(blocker.name, "prof")):
+                pass
+        self.assertIn("could not save", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from inventory_manager import InventoryWatcher, load_inventory, save_inventory
+
+
+def make_items(count):
+    """Return count items named item000, item001, ..."""
+    return {f"item{i:03d}": {"name": f"item{i:03d}", "quantity": 10, "price": 1.5}
+            for i in range(count)}
+
+
+class InventoryWatcherTest(unittest.TestCase):
+    """Tests for incremental reloading of the inventory file."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "inventory.csv")
+        save_inventory(make_items(20), self.path)
+        self.watcher = InventoryWatcher(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def bump_mtime(self):
+        """Move the mtime forward so a quick rewrite is always noticed."""
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_append_reads_new_rows(self):
+        with open(self.path, "a") as f:
+            f.write("pen,2,0.5\nitem005,3,1.5\n")
+        events = self.watcher.poll()
+
+        self.assertEqual([(e.kind, e.name) for e in events],
+                         [("added", "pen"), ("changed", "item005")])
+        self.assertEqual(self.watcher.items["item005"]["quantity"], 3)
+        self.assertIn("pen", self.watcher.low_stock)
+
+    def test_half_written_line_waits_for_newline(self):
+        with open(self.path, "a") as f:
+            f.write("pen,2")
+        self.assertEqual(self.watcher.poll(), [])
+
+        with open(self.path, "a") as f:
+            f.write(",0.5\n")
+        self.assertEqual([e.name for e in self.watcher.poll()], ["pen"])
+
+    def test_same_inode_same_length_rewrite(self):
+        inode = os.stat(self.path).st_ino
+        with open(self.path, "r+") as f:
+            data = f.read()
+            f.seek(0)
+            f.write(data.replace("item000,10", "item000,11"))
+        self.bump_mtime()
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+
+        events = self.watcher.poll()
+        self.assertEqual([(e.kind, e.name) for e in events], [("changed", "item000")])
+        self.assertEqual(self.watcher.items["item000"]["quantity"], 11)
+
+    def test_rewrite_through_save_inventory(self):
+        items = make_items(20)
+        items["item001"]["quantity"] = 99
+        del items["item002"]
+        save_inventory(items, self.path)
+        self.bump_mtime()
+
+        events = self.watcher.poll()
+        self.assertEqual(sorted((e.kind, e.name) for e in events),
+                         [("changed", "item001"), ("removed", "item002")])
+        self.assertEqual(self.watcher.items, items)
+
+    def test_rewrite_that_grows_is_not_an_append(self):
+        items = make_items(21)
+        items["item000"]["quantity"] = 1
+        save_inventory(items, self.path)
+        self.bump_mtime()
+
+        events = self.watcher.poll()
+        self.assertEqual(sorted((e.kind, e.name) for e in events),
+                         [("added", "item020"), ("changed", "item000")])
+        self.assertIn("item000", self.watcher.low_stock)
+
+    def test_large_rewrite_with_same_length_change_and_growth(self):
+        items = make_items(1000)
+        save_inventory(items, self.path)
+        self.bump_mtime()
+        self.watcher.poll()
+
+        items["item500"]["quantity"] = 11
+        items["new"] = {"name": "new", "quantity": 1, "price": 2.0}
+        save_inventory(items, self.path)
+        self.bump_mtime()
+
+        events = self.watcher.poll()
+        self.assertEqual(sorted((e.kind, e.name) for e in events),
+                         [("added", "new"), ("changed", "item500")])
+        self.assertEqual(self.watcher.items, load_inventory(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
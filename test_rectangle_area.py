@@ -0,0 +1,165 @@
+import io
+import random
+import struct
+import unittest
+
+from rectangle_area import (GridIndex, Rect, brute_force_pairs, brute_force_point,
+                            bulk_areas, make_rect, read_binary_chunks, read_csv_chunks,
+                            union_area)
+
+
+class ShortReadStream(io.BytesIO):
+    """BytesIO that returns at most a few bytes per read(), like a pipe."""
+
+    def read(self, size=-1):
+        return super().read(min(size, 5) if size and size > 0 else 5)
+
+
+def chunks_as_lists(chunks):
+    """Turn (lengths, widths) chunks of any sequence type into lists."""
+    return [(list(lengths), list(widths)) for lengths, widths in chunks]
+
+
+def brute_force_union(rects):
+    """Union area by checking every cell of the compressed coordinate grid."""
+    xs = sorted({v for r in rects for v in (r.x1, r.x2)})
+    ys = sorted({v for r in rects for v in (r.y1, r.y2)})
+    area = 0.0
+    for x1, x2 in zip(xs, xs[1:]):
+        for y1, y2 in zip(ys, ys[1:]):
+            cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+            if any(r.x1 < cx < r.x2 and r.y1 < cy < r.y2 for r in rects):
+                area += (x2 - x1) * (y2 - y1)
+    return area
+
+
+def random_int_rects(rng, count, world=20, max_size=8):
+    """Generate small integer rectangles so edges often touch or coincide."""
+    return [make_rect(rng.randint(0, world), rng.randint(0, world),
+                      rng.randint(0, max_size), rng.randint(0, max_size))
+            for _ in range(count)]
+
+
+class UnionAreaTest(unittest.TestCase):
+    """Tests for the sweep-line union area."""
+
+    def test_known_values(self):
+        self.assertEqual(union_area([]), 0.0)
+        self.assertEqual(union_area([Rect(0, 0, 2, 2), Rect(1, 1, 3, 3)]), 7.0)
+        self.assertEqual(union_area([Rect(0, 0, 1, 1), Rect(0, 0, 1, 1)]), 1.0)
+        self.assertEqual(union_area([Rect(0, 0, 4, 4), Rect(1, 1, 2, 2)]), 16.0)
+        self.assertEqual(union_area([Rect(0, 0, 0, 5)]), 0.0)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            rects = random_int_rects(rng, rng.randint(1, 15))
+            self.assertAlmostEqual(union_area(rects), brute_force_union(rects))
+
+
+class GridIndexTest(unittest.TestCase):
+    """Tests for the grid index against brute force."""
+
+    def check_against_brute_force(self, rects, rng):
+        index = GridIndex(rects)
+        self.assertEqual(sorted(index.overlapping_pairs()), brute_force_pairs(rects))
+        for _ in range(50):
+            x, y = rng.uniform(-5, 30), rng.uniform(-5, 30)
+            self.assertEqual(index.query_point(x, y), brute_force_point(rects, x, y))
+            query = make_rect(x, y, rng.uniform(0, 10), rng.uniform(0, 10))
+            expected = [i for i, r in enumerate(rects)
+                        if r.x1 < query.x2 and query.x1 < r.x2
+                        and r.y1 < query.y2 and query.y1 < r.y2]
+            self.assertEqual(index.query_overlaps(query), expected)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            self.check_against_brute_force(random_int_rects(rng, rng.randint(1, 30)), rng)
+
+    def test_large_rectangles(self):
+        rng = random.Random(2)
+        rects = random_int_rects(rng, 50)
+        rects += [Rect(-10, -10, 20000, 20000), Rect(5, 5, 15000, 15000)]
+        index = GridIndex(rects)
+
+        self.assertEqual(sorted(index.large), [50, 51])
+        self.assertLess(len(index.cells), 50 * GridIndex.MAX_CELLS_PER_RECT)
+        self.check_against_brute_force(rects, rng)
+
+    def test_points_on_edges(self):
+        index = GridIndex([Rect(0, 0, 1, 1), Rect(1, 0, 2, 1)])
+        self.assertEqual(index.query_point(1, 1), [0, 1])
+        self.assertEqual(index.overlapping_pairs(), [])
+
+
+class ReadCsvChunksTest(unittest.TestCase):
+    """Tests for parsing CSV input in bulk mode."""
+
+    def read(self, text, chunk_size=100):
+        return chunks_as_lists(read_csv_chunks(io.StringIO(text), chunk_size))
+
+    def test_header_and_blank_lines(self):
+        self.assertEqual(self.read("\nlength,width\n2,3\n\n4.5,2\n"),
+                         [([2.0, 4.5], [3.0, 2.0])])
+        self.assertEqual(self.read("2,3\n"), [([2.0], [3.0])])
+
+    def test_bad_rows(self):
+        for text in ["4\n", "2,3\n2,3,9\n", "2,3\nlength,width\n", "2,x\n"]:
+            with self.assertRaises(ValueError):
+                self.read(text)
+
+        with self.assertRaisesRegex(ValueError, "Line 3"):
+            self.read("length,width\n2,3\n5\n")
+
+    def test_chunk_boundaries(self):
+        text = "".join(f"{i},1\n" for i in range(5))
+        self.assertEqual(self.read(text, chunk_size=2),
+                         [([0.0, 1.0], [1.0, 1.0]), ([2.0, 3.0], [1.0, 1.0]),
+                          ([4.0], [1.0])])
+        self.assertEqual(self.read(text, chunk_size=5),
+                         [([0.0, 1.0, 2.0, 3.0, 4.0], [1.0] * 5)])
+
+
+class ReadBinaryChunksTest(unittest.TestCase):
+    """Tests for parsing float64 input in bulk mode."""
+
+    def test_short_reads(self):
+        data = struct.pack("=6d", 1, 2, 3, 4, 5, 6)
+        chunks = chunks_as_lists(read_binary_chunks(ShortReadStream(data), 2))
+
+        lengths = [x for chunk in chunks for x in chunk[0]]
+        widths = [x for chunk in chunks for x in chunk[1]]
+        self.assertEqual(lengths, [1.0, 3.0, 5.0])
+        self.assertEqual(widths, [2.0, 4.0, 6.0])
+
+    def test_incomplete_trailing_record(self):
+        data = struct.pack("=3d", 1, 2, 3)
+        with self.assertRaisesRegex(ValueError, "incomplete record"):
+            list(read_binary_chunks(io.BytesIO(data)))
+
+
+class BulkAreasTest(unittest.TestCase):
+    """Round trips through bulk_areas()."""
+
+    def test_csv_round_trip(self):
+        out = io.StringIO()
+        count = bulk_areas(io.StringIO("length,width\n2,3\n0.5,4\n1,1\n"), out,
+                           chunk_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual([float(x) for x in out.getvalue().split()], [6.0, 2.0, 1.0])
+
+    def test_binary_round_trip(self):
+        source = io.BytesIO(struct.pack("=6d", 2, 3, 0.5, 4, 1, 1))
+        out = io.BytesIO()
+        self.assertEqual(bulk_areas(source, out, binary=True, chunk_size=2), 3)
+        self.assertEqual(struct.unpack("=3d", out.getvalue()), (6.0, 2.0, 1.0))
+
+    def test_error_reports_absolute_index(self):
+        text = "".join(f"{i},1\n" for i in range(5)) + "1,-1\n"
+        with self.assertRaisesRegex(ValueError, "rectangle 5"):
+            bulk_areas(io.StringIO(text), io.StringIO(), chunk_size=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 
+from instrumentation import instrument
+
 
 class TodoApp:
     """Simple To-Do List GUI Application."""
@@ -127,6 +129,7 @@ class TodoApp:
         )
         self.status_label.pack(pady=10)
     
+    @instrument
     def add_task(self):
         """Add a new task."""
         task = self.task_entry.get().strip()
@@ -140,6 +143,7 @@ class TodoApp:
         self.task_entry.delete(0, tk.END)
         self.update_status()
     
+    @instrument
     def complete_task(self):
         """Mark selected task as completed."""
         try:
@@ -154,6 +158,7 @@ class TodoApp:
         except IndexError:
             messagebox.showwarning("Warning", "Please select a task!")
     
+    @instrument
     def delete_task(self):
         """Delete selected task."""
         try:
@@ -164,6 +169,7 @@ class TodoApp:
         except IndexError:
             messagebox.showwarning("Warning", "Please select a task!")
     
+    @instrument
     def clear_all(self):
         """Clear all tasks."""
         if self.tasks:
@@ -179,8 +185,12 @@ class TodoApp:
         self.status_label.config(text=f"Tasks: {total} | Completed: {completed}")
 
 
-# Run the application
-if __name__ == "__main__":
+def main():
+    """Run the application."""
     root = tk.Tk()
     app = TodoApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,7 +1,13 @@
+from instrumentation import instrument, profile_action
+
 # Global list to store tasks
 todo_list = []
 
+# Menu choices and the names used when profiling them
+MENU_ACTIONS = {"1": "add", "2": "view", "3": "complete", "4": "delete"}
+
 
+@instrument
 def add_task(name):
     """Adds a new task to the list."""
     if name.strip():
@@ -23,6 +29,7 @@ def display_tasks():
         print(f"{i}. [{status}] {task['name']}")
 
 
+@instrument
 def mark_completed(task_num):
     """Marks a task as completed."""
     if 1 <= task_num <= len(todo_list):
@@ -32,6 +39,7 @@ def mark_completed(task_num):
         print("Error: Invalid task number.")
 
 
+@instrument
 def delete_task(task_num):
     """Deletes a task from the list."""
     if 1 <= task_num <= len(todo_list):
@@ -48,28 +56,31 @@ def main():
     while True:
         print("\n1. Add  2. View  3. Complete  4. Delete  5. Exit")
         choice = input("Choice: ").strip()
-        
-        if choice == "1":
-            add_task(input("Task name: "))
-        elif choice == "2":
-            display_tasks()
-        elif choice == "3":
-            display_tasks()
-            try:
-                mark_completed(int(input("Task number: ")))
-            except ValueError:
-                print("Enter a valid number.")
-        elif choice == "4":
-            display_tasks()
-            try:
-                delete_task(int(input("Task number: ")))
-            except ValueError:
-                print("Enter a valid number.")
-        elif choice == "5":
+        if choice == "5":
             print("Goodbye!")
             break
-        else:
+        if choice not in MENU_ACTIONS:
             print("Invalid choice.")
+            continue
+        
+        # Profiled only when INSTRUMENTATION_PROFILE is set
+        with profile_action(f"todo-{MENU_ACTIONS[choice]}"):
+            if choice == "1":
+                add_task(input("Task name: "))
+            elif choice == "2":
+                display_tasks()
+            elif choice == "3":
+                display_tasks()
+                try:
+                    mark_completed(int(input("Task number: ")))
+                except ValueError:
+                    print("Enter a valid number.")
+            elif choice == "4":
+                display_tasks()
+                try:
+                    delete_task(int(input("Task number: ")))
+                except ValueError:
+                    print("Enter a valid number.")
 
 
 if __name__ == "__main__":